@@ -15,6 +15,22 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+category_type_enum = postgresql.ENUM(
+    'revenue', 'expense', 'metric', name='category_type', create_type=False
+)
+
+# budget_lines and actuals are hash partitioned by practice_id so per-practice
+# reports scan a single partition
+PARTITION_COUNT = 16
+
+
+def create_hash_partitions(table_name: str) -> None:
+    for remainder in range(PARTITION_COUNT):
+        op.execute(
+            f"CREATE TABLE {table_name}_p{remainder} PARTITION OF {table_name} "
+            f"FOR VALUES WITH (MODULUS {PARTITION_COUNT}, REMAINDER {remainder})"
+        )
+
 
 def upgrade() -> None:
     # Create practices table
@@ -24,7 +40,8 @@ def upgrade() -> None:
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('location', sa.String(length=255), nullable=False),
         sa.Column('status', sa.String(length=50), nullable=True),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
     )
     op.create_index(op.f('ix_practices_id'), 'practices', ['id'], unique=False)
 
@@ -37,17 +54,20 @@ def upgrade() -> None:
         sa.Column('start_date', sa.Date(), nullable=False),
         sa.Column('end_date', sa.Date(), nullable=False),
         sa.ForeignKeyConstraint(['practice_id'], ['practices.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('practice_id', 'year')
     )
     op.create_index(op.f('ix_fiscal_years_id'), 'fiscal_years', ['id'], unique=False)
 
-    # Create account_categories table
+    # Create account_categories table; category_type is an enum so grouping
+    # and indexing hash a 4-byte value instead of text
+    category_type_enum.create(op.get_bind())
     op.create_table(
         'account_categories',
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('code', sa.String(length=20), nullable=False),
         sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('category_type', sa.String(length=50), nullable=False),
+        sa.Column('category_type', category_type_enum, nullable=False),
         sa.Column('parent_id', sa.Integer(), nullable=True),
         sa.Column('level', sa.Integer(), nullable=True),
         sa.Column('sort_order', sa.Integer(), nullable=True),
@@ -65,35 +85,40 @@ def upgrade() -> None:
         sa.Column('period_date', sa.Date(), nullable=False),
         sa.Column('status', sa.String(length=50), nullable=True),
         sa.ForeignKeyConstraint(['fiscal_year_id'], ['fiscal_years.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('fiscal_year_id', 'period_month')
     )
     op.create_index(op.f('ix_budget_periods_id'), 'budget_periods', ['id'], unique=False)
 
     # Create budget_lines table
     op.create_table(
         'budget_lines',
-        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
         sa.Column('practice_id', sa.Integer(), nullable=False),
         sa.Column('budget_period_id', sa.Integer(), nullable=False),
         sa.Column('category_id', sa.Integer(), nullable=False),
         sa.Column('month', sa.Integer(), nullable=False),
         sa.Column('budget_amount', sa.Numeric(precision=15, scale=2), nullable=True),
         sa.Column('actual_amount', sa.Numeric(precision=15, scale=2), nullable=True),
-        sa.Column('variance', sa.Numeric(precision=15, scale=2), nullable=True),
+        sa.Column('variance', sa.Numeric(precision=15, scale=2), sa.Computed('actual_amount - budget_amount', persisted=True), nullable=True),
         sa.Column('notes', sa.Text(), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=True),
         sa.Column('updated_at', sa.DateTime(), nullable=True),
         sa.ForeignKeyConstraint(['budget_period_id'], ['budget_periods.id'], ),
         sa.ForeignKeyConstraint(['category_id'], ['account_categories.id'], ),
         sa.ForeignKeyConstraint(['practice_id'], ['practices.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id', 'practice_id'),
+        postgresql_partition_by='HASH (practice_id)'
     )
+    create_hash_partitions('budget_lines')
     op.create_index(op.f('ix_budget_lines_id'), 'budget_lines', ['id'], unique=False)
+    op.create_index('ix_budget_lines_practice_period', 'budget_lines', ['practice_id', 'budget_period_id'], unique=False)
+    op.create_index('ix_budget_lines_practice_cat', 'budget_lines', ['practice_id', 'category_id'], unique=False)
 
     # Create actuals table
     op.create_table(
         'actuals',
-        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
         sa.Column('practice_id', sa.Integer(), nullable=False),
         sa.Column('category_id', sa.Integer(), nullable=False),
         sa.Column('period_date', sa.Date(), nullable=False),
@@ -102,9 +127,13 @@ def upgrade() -> None:
         sa.Column('imported_at', sa.Date(), nullable=True),
         sa.ForeignKeyConstraint(['category_id'], ['account_categories.id'], ),
         sa.ForeignKeyConstraint(['practice_id'], ['practices.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id', 'practice_id'),
+        postgresql_partition_by='HASH (practice_id)'
     )
+    create_hash_partitions('actuals')
     op.create_index(op.f('ix_actuals_id'), 'actuals', ['id'], unique=False)
+    # Serves the variance and P&L filters on practice and period date
+    op.create_index('ix_actuals_practice_date_cat', 'actuals', ['practice_id', 'period_date', 'category_id'], unique=False)
 
     # Create users table
     op.create_table(
@@ -115,6 +144,7 @@ def upgrade() -> None:
         sa.Column('full_name', sa.String(length=255), nullable=False),
         sa.Column('role', sa.String(length=50), nullable=True),
         sa.Column('practice_id', sa.Integer(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
         sa.Column('last_login', sa.Date(), nullable=True),
         sa.ForeignKeyConstraint(['practice_id'], ['practices.id'], ),
         sa.PrimaryKeyConstraint('id'),
@@ -145,14 +175,18 @@ def downgrade() -> None:
     op.drop_index(op.f('ix_users_id'), table_name='users')
     op.drop_index(op.f('ix_users_email'), table_name='users')
     op.drop_table('users')
+    op.drop_index('ix_actuals_practice_date_cat', table_name='actuals')
     op.drop_index(op.f('ix_actuals_id'), table_name='actuals')
     op.drop_table('actuals')
+    op.drop_index('ix_budget_lines_practice_cat', table_name='budget_lines')
+    op.drop_index('ix_budget_lines_practice_period', table_name='budget_lines')
     op.drop_index(op.f('ix_budget_lines_id'), table_name='budget_lines')
     op.drop_table('budget_lines')
     op.drop_index(op.f('ix_budget_periods_id'), table_name='budget_periods')
     op.drop_table('budget_periods')
     op.drop_index(op.f('ix_account_categories_id'), table_name='account_categories')
     op.drop_table('account_categories')
+    category_type_enum.drop(op.get_bind())
     op.drop_index(op.f('ix_fiscal_years_id'), table_name='fiscal_years')
     op.drop_table('fiscal_years')
     op.drop_index(op.f('ix_practices_id'), table_name='practices')
@@ -0,0 +1,45 @@
+"""In-process cache of account categories
+
+Categories are a small table that changes rarely, so reports look up
+names and types here instead of joining account_categories on every call.
+"""
+
+import os
+import time
+from typing import Dict, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import AccountCategory
+
+# Seconds before the cache is reloaded to pick up category edits
+CATEGORY_CACHE_TTL = int(os.getenv("CATEGORY_CACHE_TTL", "300"))
+
+
+class CategoryCache:
+    """Maps category id to its (id, name, category_type) row."""
+
+    def __init__(self, ttl: int = CATEGORY_CACHE_TTL):
+        self.ttl = ttl
+        self.categories: Dict[int, Row] = {}
+        self.loaded_at = 0.0
+
+    async def load(self, db: AsyncSession) -> None:
+        """Reload every category from the database."""
+        result = await db.execute(
+            select(AccountCategory.id, AccountCategory.name, AccountCategory.category_type)
+        )
+        self.categories = {row.id: row for row in result}
+        self.loaded_at = time.monotonic()
+
+    async def get(self, db: AsyncSession, ids: Iterable[int] = ()) -> Dict[int, Row]:
+        """Return the cached categories, reloading when stale or missing any of ids."""
+        expired = time.monotonic() - self.loaded_at > self.ttl
+        if expired or any(category_id not in self.categories for category_id in ids):
+            await self.load(db)
+        return self.categories
+
+
+category_cache = CategoryCache()
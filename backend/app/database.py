@@ -1,38 +1,58 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 # Database configuration from environment variables
-DATABASE_URL = os.getenv(
+# The psycopg (v3) driver is used regardless of the scheme given in the URL
+DATABASE_URL = make_url(os.getenv(
     "DATABASE_URL",
     f"postgresql://{os.getenv('DB_USER', 'budget_user')}:"
     f"{os.getenv('DB_PASSWORD', 'budget_password_123')}@"
     f"{os.getenv('DB_HOST', 'postgres')}:"
     f"{os.getenv('DB_PORT', '5432')}/"
     f"{os.getenv('DB_NAME', 'dental_budget')}"
-)
+)).set(drivername="postgresql+psycopg")
+
+# Prepare statements server-side on first execution so Postgres caches the
+# plan per connection
+DB_PREPARE_THRESHOLD = os.getenv("DB_PREPARE_THRESHOLD", "0")
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    DATABASE_URL,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_recycle=3600
+# Connection pool options shared by the sync and async engines
+# Defaults target a direct PostgreSQL connection (as in docker-compose):
+# connections live for an hour so their prepared plans are reused across
+# many requests. Behind PgBouncer in transaction pooling mode set
+# DB_PREPARE_THRESHOLD=none (prepared statements do not survive server
+# connection switches before 1.21 / without max_prepared_statements),
+# DB_PRE_PING=false, and DB_POOL_RECYCLE below its server_idle_timeout.
+ENGINE_OPTIONS = dict(
+    pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "5")),
+    pool_pre_ping=os.getenv("DB_PRE_PING", "true").lower() == "true",
+    pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
+    pool_timeout=30,
+    connect_args={
+        "prepare_threshold": None if DB_PREPARE_THRESHOLD.lower() == "none" else int(DB_PREPARE_THRESHOLD)
+    }
 )
 
-# Create session factory
+# Sync engine for scripts (seeding); the API uses the async engine
+engine = create_engine(DATABASE_URL, **ENGINE_OPTIONS)
+
+# Async engine for request handlers, on psycopg's asyncio support
+async_engine = create_async_engine(DATABASE_URL, **ENGINE_OPTIONS)
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
 
 # Dependency to get database session
-def get_db():
+async def get_db():
     """Database session dependency for FastAPI"""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,5 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import os
 
 # Import routers
@@ -9,7 +11,10 @@ from app.routers import budget, practices, reports, auth
 app = FastAPI(
     title="Dental Budget API",
     description="API for managing dental practice budgets",
-    version="1.0.0"
+    version="1.0.0",
+    # Serialize responses with orjson; FastAPI hands it JSON-ready data, so
+    # Decimal and date values are already encoded by the response models
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -21,6 +26,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (reports are repetitive JSON); small ones are
+# sent as-is since compressing them costs more than it saves
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(budget.router)
 app.include_router(practices.router)
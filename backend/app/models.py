@@ -1,17 +1,18 @@
-from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Boolean, Text
+from sqlalchemy import Column, Integer, String, Numeric, Date, DateTime, ForeignKey, Boolean, Text, Computed, Enum, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.ext.declarative import declarative_base
-from datetime import datetime
+from datetime import date, datetime
 
-Base = declarative_base()
+# Models register on the shared Base so Alembic autogenerate sees them
+from app.database import Base
 
 class Practice(Base):
     """Dental Practice Model"""
     __tablename__ = "practices"
     
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), nullable=False, index=True)
-    location = Column(String(255))
+    name = Column(String(255), nullable=False, unique=True)
+    location = Column(String(255), nullable=False)
     status = Column(String(50), default="active")
     
     # Relationships
@@ -21,6 +22,7 @@ class Practice(Base):
 class FiscalYear(Base):
     """Fiscal Year Model"""
     __tablename__ = "fiscal_years"
+    __table_args__ = (UniqueConstraint("practice_id", "year"),)
     
     id = Column(Integer, primary_key=True, index=True)
     practice_id = Column(Integer, ForeignKey("practices.id"), nullable=False)
@@ -30,16 +32,16 @@ class FiscalYear(Base):
     
     # Relationships
     practice = relationship("Practice", back_populates="fiscal_years")
-    budget_lines = relationship("BudgetLine", back_populates="fiscal_year")
-        budget_periods = relationship("BudgetPeriod", back_populates="fiscal_year")
+    budget_periods = relationship("BudgetPeriod", back_populates="fiscal_year")
 
 class AccountCategory(Base):
     """Account Category Model for P&L Structure"""
     __tablename__ = "account_categories"
     
     id = Column(Integer, primary_key=True, index=True)
+    code = Column(String(20), nullable=False)
     name = Column(String(255), nullable=False)
-    category_type = Column(String(50))  # revenue, expense
+    category_type = Column(Enum('revenue', 'expense', 'metric', name='category_type'), nullable=False)
     parent_id = Column(Integer, ForeignKey("account_categories.id"))
     level = Column(Integer, default=0)
     sort_order = Column(Integer, default=0)
@@ -48,10 +50,77 @@ class AccountCategory(Base):
     children = relationship("AccountCategory")
     budget_lines = relationship("BudgetLine", back_populates="category")
 
+class BudgetPeriod(Base):
+    """Monthly Budget Period Model"""
+    __tablename__ = "budget_periods"
+    __table_args__ = (UniqueConstraint("fiscal_year_id", "period_month"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    fiscal_year_id = Column(Integer, ForeignKey("fiscal_years.id"), nullable=False)
+    period_month = Column(Integer, nullable=False)
+    period_date = Column(Date, nullable=False)
+    status = Column(String(50), default="draft")
+    
+    # Relationships
+    fiscal_year = relationship("FiscalYear", back_populates="budget_periods")
+    budget_lines = relationship("BudgetLine", back_populates="period")
+
 class BudgetLine(Base):
     """Budget Line Item Model"""
     __tablename__ = "budget_lines"
     
-    id = Column(Integer, primary_key=True, index=True)
-    practice_id = Column(Integer, ForeignKey("practices.id"), nullable=False)
+    # Hash partitioned by practice_id, which must be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    practice_id = Column(Integer, ForeignKey("practices.id"), primary_key=True)
     budget_period_id = Column(Integer, ForeignKey("budget_periods.id"), nullable=False)
+    category_id = Column(Integer, ForeignKey("account_categories.id"), nullable=False)
+    month = Column(Integer, nullable=False)
+    budget_amount = Column(Numeric(15, 2))
+    actual_amount = Column(Numeric(15, 2))
+    variance = Column(Numeric(15, 2), Computed("actual_amount - budget_amount", persisted=True))
+    notes = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relationships
+    practice = relationship("Practice", back_populates="budget_lines")
+    period = relationship("BudgetPeriod", back_populates="budget_lines")
+    category = relationship("AccountCategory", back_populates="budget_lines")
+
+class Actuals(Base):
+    """Actual Financial Results Model"""
+    __tablename__ = "actuals"
+    
+    # Hash partitioned by practice_id, which must be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    practice_id = Column(Integer, ForeignKey("practices.id"), primary_key=True)
+    category_id = Column(Integer, ForeignKey("account_categories.id"), nullable=False)
+    period_date = Column(Date, nullable=False)
+    amount = Column(Numeric(15, 2), nullable=False)
+    source = Column(String(50), default="manual")  # manual, quickbooks, xero, import
+    imported_at = Column(Date, default=date.today)
+
+class User(Base):
+    """Application User Model"""
+    __tablename__ = "users"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    email = Column(String(255), nullable=False, unique=True, index=True)
+    hashed_password = Column(String(255), nullable=False)
+    full_name = Column(String(255), nullable=False)
+    role = Column(String(50), default="viewer")
+    practice_id = Column(Integer, ForeignKey("practices.id"))
+    is_active = Column(Boolean, default=True)
+    last_login = Column(Date)
+
+class AuditLog(Base):
+    """Audit Trail Model"""
+    __tablename__ = "audit_log"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    action = Column(String(100), nullable=False)
+    table_name = Column(String(100), nullable=False)
+    record_id = Column(Integer)
+    changes = Column(JSONB)
+    timestamp = Column(DateTime, default=datetime.utcnow)
@@ -1,11 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from pydantic import BaseModel
 from decimal import Decimal
+from datetime import datetime
+
+from app.database import get_db
+from app.models import BudgetLine
+from app import schemas
 
 router = APIRouter(prefix="/api/v1/budget", tags=["budget"])
 
+# Bulk inserts larger than this are loaded with COPY instead of INSERT
+COPY_THRESHOLD = 1000
+
+# Column order and Postgres types for binary COPY into budget_lines
+BULK_COPY_COLUMNS = (
+    ("practice_id", "int4"),
+    ("budget_period_id", "int4"),
+    ("category_id", "int4"),
+    ("month", "int4"),
+    ("budget_amount", "numeric"),
+    ("actual_amount", "numeric"),
+    ("notes", "text"),
+    ("created_at", "timestamp"),
+    ("updated_at", "timestamp"),
+)
+
 # Pydantic schemas
 class BudgetLineCreate(BaseModel):
     practice_id: int
@@ -80,3 +102,36 @@ async def create_budget_line(line: BudgetLineCreate):
         "variance": line.actual_amount - line.budget_amount,
         "notes": line.notes
     }
+
+@router.post("/lines/bulk", status_code=status.HTTP_201_CREATED)
+async def create_budget_lines_bulk(
+    lines: List[schemas.BudgetLineCreate],
+    db: AsyncSession = Depends(get_db)
+):
+    """Create many budget lines in a single transaction"""
+    # schemas.BudgetLineCreate matches the budget_lines table; the local
+    # BudgetLineCreate above is the request body of the mock /lines endpoint
+    now = datetime.utcnow()
+    rows = [
+        {**line.model_dump(), "created_at": now, "updated_at": now}
+        for line in lines
+    ]
+    
+    if len(rows) > COPY_THRESHOLD:
+        # Binary COPY skips per-row statement parsing and text conversion
+        columns = ", ".join(name for name, _ in BULK_COPY_COLUMNS)
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        async with raw_connection.driver_connection.cursor() as cursor:
+            async with cursor.copy(f"COPY budget_lines ({columns}) FROM STDIN (FORMAT BINARY)") as copy:
+                copy.set_types([pg_type for _, pg_type in BULK_COPY_COLUMNS])
+                for row in rows:
+                    await copy.write_row([row[name] for name, _ in BULK_COPY_COLUMNS])
+    elif rows:
+        # psycopg runs executemany in pipeline mode: one INSERT per row, all
+        # sent in a single round trip
+        await db.execute(insert(BudgetLine), rows)
+    
+    await db.commit()
+    
+    return {"inserted": len(rows)}
@@ -3,10 +3,11 @@
 Provides CRUD endpoints for managing dental practice entities.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.exc import IntegrityError
 
 from app.database import get_db
 from app.models import Practice as PracticeModel
@@ -17,27 +18,48 @@ router = APIRouter(
     tags=["practices"]
 )
 
+# OFFSET scans every skipped row, so deep pages must use after_id instead
+MAX_SKIP = 1000
+MAX_PAGE_SIZE = 500
+
+# Module-level statements with bound parameters reuse SQLAlchemy's compiled
+# SQL cache across requests. Ids start at 1, so after_id=0 is page one.
+_LIST_PRACTICES = select(PracticeModel).where(
+    PracticeModel.id > bindparam("after_id")
+).order_by(
+    PracticeModel.id
+).offset(
+    bindparam("skip")
+).limit(
+    bindparam("limit")
+)
+
 
 @router.get("/", response_model=List[schemas.Practice])
-def get_practices(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+async def get_practices(
+    after_id: Optional[int] = Query(None, description="Return practices with an id greater than this"),
+    skip: int = Query(0, ge=0, le=MAX_SKIP, description="Offset for small pages; prefer after_id"),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get all practices with pagination."""
-    practices = db.query(PracticeModel).offset(skip).limit(limit).all()
-    return practices
+    """Get practices ordered by id with keyset pagination.
+    
+    Pass the id of the last practice received as after_id to fetch the next page.
+    """
+    result = await db.scalars(
+        _LIST_PRACTICES,
+        {"after_id": after_id or 0, "skip": skip, "limit": limit}
+    )
+    return result.all()
 
 
 @router.get("/{practice_id}", response_model=schemas.Practice)
-def get_practice(
+async def get_practice(
     practice_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a specific practice by ID."""
-    practice = db.query(PracticeModel).filter(
-        PracticeModel.id == practice_id
-    ).first()
+    practice = await db.get(PracticeModel, practice_id)
     
     if not practice:
         raise HTTPException(
@@ -49,40 +71,54 @@ def get_practice(
 
 
 @router.post("/", response_model=schemas.Practice, status_code=status.HTTP_201_CREATED)
-def create_practice(
+async def create_practice(
     practice: schemas.PracticeCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new practice."""
-    # Check if practice with same name already exists
-    existing = db.query(PracticeModel).filter(
-        PracticeModel.name == practice.name
-    ).first()
+    db_practice = PracticeModel(**practice.dict())
+    db.add(db_practice)
     
-    if existing:
+    # Duplicate names are rejected by the unique constraint on insert
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Practice with name '{practice.name}' already exists"
         )
     
-    db_practice = PracticeModel(**practice.dict())
-    db.add(db_practice)
-    db.commit()
-    db.refresh(db_practice)
+    await db.refresh(db_practice)
     
     return db_practice
 
 
 @router.put("/{practice_id}", response_model=schemas.Practice)
-def update_practice(
+async def update_practice(
     practice_id: int,
     practice_update: schemas.PracticeUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update an existing practice."""
-    db_practice = db.query(PracticeModel).filter(
-        PracticeModel.id == practice_id
-    ).first()
+    # Update only provided fields, in a single UPDATE ... RETURNING
+    update_data = practice_update.model_dump(exclude_unset=True)
+    
+    if update_data:
+        try:
+            db_practice = await db.scalar(
+                update(PracticeModel).where(
+                    PracticeModel.id == practice_id
+                ).values(**update_data).returning(PracticeModel)
+            )
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Practice with name '{practice_update.name}' already exists"
+            )
+    else:
+        db_practice = await db.get(PracticeModel, practice_id)
     
     if not db_practice:
         raise HTTPException(
@@ -90,34 +126,29 @@ def update_practice(
             detail=f"Practice with id {practice_id} not found"
         )
     
-    # Update only provided fields
-    update_data = practice_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_practice, field, value)
-    
-    db.commit()
-    db.refresh(db_practice)
+    await db.commit()
     
     return db_practice
 
 
 @router.delete("/{practice_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_practice(
+async def delete_practice(
     practice_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a practice."""
-    db_practice = db.query(PracticeModel).filter(
-        PracticeModel.id == practice_id
-    ).first()
+    deleted_id = await db.scalar(
+        delete(PracticeModel).where(
+            PracticeModel.id == practice_id
+        ).returning(PracticeModel.id)
+    )
     
-    if not db_practice:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Practice with id {practice_id} not found"
         )
     
-    db.delete(db_practice)
-    db.commit()
+    await db.commit()
     
     return None
@@ -5,18 +5,21 @@ Provides endpoints for variance analysis and P&L reporting.
 
 from datetime import date
 from decimal import Decimal
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy import bindparam, exists, func, select
 
-from app.database import get_db
+from app.cache import category_cache
+from app.database import AsyncSessionLocal, get_db
 from app.models import (
     Practice as PracticeModel,
     BudgetPeriod,
     BudgetLine,
-    Actuals,
-    AccountCategory
+    Actuals
 )
 from app import schemas
 
@@ -25,18 +28,125 @@ router = APIRouter(
     tags=["reports"]
 )
 
+# Rows fetched per server-side cursor batch when streaming reports
+STREAM_BATCH_SIZE = 1000
+
+_ZERO = Decimal('0')
+
+# Actuals summed per category for one practice and period date, so each
+# budget line joins to at most one row
+_PERIOD_ACTUALS = select(
+    Actuals.category_id,
+    func.sum(Actuals.amount).label('amount')
+).where(
+    Actuals.practice_id == bindparam('practice_id'),
+    Actuals.period_date == bindparam('period_date')
+).group_by(
+    Actuals.category_id
+).subquery()
+
+_budget_amount = func.coalesce(BudgetLine.budget_amount, 0)
+_actual_amount = func.coalesce(_PERIOD_ACTUALS.c.amount, 0)
+
+# Budget lines joined to actuals; rows stream out as Postgres produces them
+# and the report totals are summed while they are written
+_VARIANCE_LINES = select(
+    BudgetLine.id,
+    BudgetLine.practice_id,
+    BudgetLine.budget_period_id,
+    BudgetLine.category_id,
+    BudgetLine.month,
+    _budget_amount.label('budget_amount'),
+    _actual_amount.label('actual_amount'),
+    (_actual_amount - _budget_amount).label('variance'),
+    BudgetLine.notes,
+    BudgetLine.created_at,
+    BudgetLine.updated_at
+).outerjoin(
+    _PERIOD_ACTUALS, _PERIOD_ACTUALS.c.category_id == BudgetLine.category_id
+).where(
+    BudgetLine.practice_id == bindparam('practice_id'),
+    BudgetLine.budget_period_id == bindparam('period_id')
+).execution_options(
+    yield_per=STREAM_BATCH_SIZE
+)
+
+# Budget periods falling inside a date range
+_PERIODS_IN_RANGE = select(BudgetPeriod.period_date).where(
+    BudgetPeriod.period_date >= bindparam('start_date'),
+    BudgetPeriod.period_date <= bindparam('end_date')
+).cte('periods')
+
+_HAS_PERIODS_IN_RANGE = select(exists(_PERIODS_IN_RANGE.select()))
+
+# Actuals per category over the periods in range; names and types come from
+# the category cache, so account_categories is not joined
+_CATEGORY_ACTUALS = select(
+    Actuals.category_id,
+    func.sum(Actuals.amount).label('total')
+).where(
+    Actuals.practice_id == bindparam('practice_id'),
+    Actuals.period_date.in_(select(_PERIODS_IN_RANGE.c.period_date))
+).group_by(
+    Actuals.category_id
+)
+
+
+async def _stream_variance_report(header: dict, result: AsyncResult) -> AsyncIterator[bytes]:
+    """Serialize a variance report as JSON one cursor batch at a time.
+    
+    Line items are written as they are fetched and the totals, summed along
+    the way, are appended after the list.
+    """
+    total_budget = _ZERO
+    total_actual = _ZERO
+    separator = b''
+    
+    yield orjson.dumps(header)[:-1] + b',"line_items":['
+    
+    async for partition in result.partitions():
+        chunk = []
+        for row in partition:
+            total_budget += row.budget_amount
+            total_actual += row.actual_amount
+            chunk.append(orjson.dumps(row._asdict(), default=str))
+        yield separator + b','.join(chunk)
+        separator = b','
+    
+    total_variance = total_actual - total_budget
+    variance_percentage = float((total_variance / total_budget * 100) if total_budget != 0 else 0)
+    
+    yield b'],' + orjson.dumps({
+        "total_budget": total_budget,
+        "total_actual": total_actual,
+        "total_variance": total_variance,
+        "variance_percentage": variance_percentage
+    }, default=str)[1:]
+
+
+async def _variance_report_body(header: dict, params: dict) -> AsyncIterator[bytes]:
+    """Stream variance report rows on a session owned by the response body.
+    
+    The request's get_db session may be closed before the body is sent
+    (FastAPI >= 0.106 exits yield dependencies first), so the server-side
+    cursor gets its own session that lives as long as the stream.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(_VARIANCE_LINES, params)
+        async for chunk in _stream_variance_report(header, result):
+            yield chunk
+
 
 @router.get("/variance/{practice_id}/{period_id}", response_model=schemas.VarianceReport)
-def get_variance_report(
+async def get_variance_report(
     practice_id: int,
     period_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Generate variance analysis report for a practice and budget period."""
-    # Verify practice exists
-    practice = db.query(PracticeModel).filter(
-        PracticeModel.id == practice_id
-    ).first()
+    # Verify practice exists; the response schemas only read scalar columns,
+    # so relationships are set to raise rather than lazy load
+    practice = await db.get(PracticeModel, practice_id, options=[raiseload('*')])
     
     if not practice:
         raise HTTPException(
@@ -45,9 +155,7 @@ def get_variance_report(
         )
     
     # Verify budget period exists
-    period = db.query(BudgetPeriod).filter(
-        BudgetPeriod.id == period_id
-    ).first()
+    period = await db.get(BudgetPeriod, period_id, options=[raiseload('*')])
     
     if not period:
         raise HTTPException(
@@ -55,75 +163,28 @@ def get_variance_report(
             detail=f"Budget period with id {period_id} not found"
         )
     
-    # Get budget lines for this practice and period
-    budget_lines = db.query(BudgetLine).join(
-        AccountCategory
-    ).filter(
-        BudgetLine.practice_id == practice_id,
-        BudgetLine.budget_period_id == period_id
-    ).all()
-    
-    # Get actuals for this practice and period
-    actuals = db.query(Actuals).filter(
-        Actuals.practice_id == practice_id,
-        Actuals.budget_period_id == period_id
-    ).all()
-    
-    # Build actuals lookup by account_category_id
-    actuals_lookup = {
-        actual.account_category_id: actual.amount
-        for actual in actuals
+    header = {
+        "practice": schemas.construct(schemas.Practice, practice).model_dump(mode="json"),
+        "period": schemas.construct(schemas.BudgetPeriod, period).model_dump(mode="json")
     }
+    params = {"practice_id": practice_id, "period_id": period_id, "period_date": period.period_date}
     
-    # Calculate totals
-    total_budget = Decimal('0')
-    total_actual = Decimal('0')
-    line_items = []
-    
-    for budget_line in budget_lines:
-        actual_amount = actuals_lookup.get(budget_line.account_category_id, Decimal('0'))
-        variance = actual_amount - budget_line.amount
-        
-        total_budget += budget_line.amount
-        total_actual += actual_amount
-        
-        line_items.append(schemas.BudgetLine(
-            id=budget_line.id,
-            practice_id=budget_line.practice_id,
-            budget_period_id=budget_line.budget_period_id,
-            account_category_id=budget_line.account_category_id,
-            amount=budget_line.amount,
-            notes=budget_line.notes,
-            created_at=budget_line.created_at,
-            updated_at=budget_line.updated_at
-        ))
-    
-    total_variance = total_actual - total_budget
-    variance_percentage = float((total_variance / total_budget * 100) if total_budget != 0 else 0)
-    
-    return schemas.VarianceReport(
-        practice=schemas.Practice.from_orm(practice),
-        period=schemas.BudgetPeriod.from_orm(period),
-        total_budget=total_budget,
-        total_actual=total_actual,
-        total_variance=total_variance,
-        variance_percentage=variance_percentage,
-        line_items=line_items
+    return StreamingResponse(
+        _variance_report_body(header, params),
+        media_type="application/json"
     )
 
 
 @router.get("/pl/{practice_id}", response_model=schemas.PLReport)
-def get_pl_report(
+async def get_pl_report(
     practice_id: int,
     start_date: date = Query(..., description="Start date for P&L report"),
     end_date: date = Query(..., description="End date for P&L report"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Generate Profit & Loss report for a practice over a date range."""
     # Verify practice exists
-    practice = db.query(PracticeModel).filter(
-        PracticeModel.id == practice_id
-    ).first()
+    practice = await db.get(PracticeModel, practice_id, options=[raiseload('*')])
     
     if not practice:
         raise HTTPException(
@@ -131,69 +192,41 @@ def get_pl_report(
             detail=f"Practice with id {practice_id} not found"
         )
     
-    # Get budget periods in date range
-    periods = db.query(BudgetPeriod).filter(
-        BudgetPeriod.start_date >= start_date,
-        BudgetPeriod.end_date <= end_date
-    ).all()
+    date_range = {"start_date": start_date, "end_date": end_date}
     
-    if not periods:
+    if not await db.scalar(_HAS_PERIODS_IN_RANGE, date_range):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No budget periods found between {start_date} and {end_date}"
         )
     
-    period_ids = [p.id for p in periods]
-    
-    # Aggregate actuals by category type
-    actuals_summary = db.query(
-        AccountCategory.category_type,
-        func.sum(Actuals.amount).label('total')
-    ).join(
-        AccountCategory, Actuals.account_category_id == AccountCategory.id
-    ).filter(
-        Actuals.practice_id == practice_id,
-        Actuals.budget_period_id.in_(period_ids)
-    ).group_by(
-        AccountCategory.category_type
-    ).all()
+    rows = (await db.execute(
+        _CATEGORY_ACTUALS, {"practice_id": practice_id, **date_range}
+    )).all()
     
-    # Initialize totals
-    total_revenue = Decimal('0')
-    total_expenses = Decimal('0')
+    categories = await category_cache.get(db, [row.category_id for row in rows])
     
-    for category_type, total in actuals_summary:
-        if category_type == 'revenue':
-            total_revenue += total or Decimal('0')
-        elif category_type == 'expense':
-            total_expenses += total or Decimal('0')
+    # Initialize totals
+    total_revenue = _ZERO
+    total_expenses = _ZERO
+    category_list = []
+    
+    for row in rows:
+        category = categories[row.category_id]
+        category_list.append(schemas.CategoryTotal.model_construct(
+            id=category.id, name=category.name, type=category.category_type, amount=row.total
+        ))
+        if category.category_type == 'revenue':
+            total_revenue += row.total
+        elif category.category_type == 'expense':
+            total_expenses += row.total
     
     net_income = total_revenue - total_expenses
     
-    # Get category details
-    categories = db.query(
-        AccountCategory.id,
-        AccountCategory.name,
-        AccountCategory.category_type,
-        func.sum(Actuals.amount).label('total')
-    ).join(
-        Actuals, AccountCategory.id == Actuals.account_category_id
-    ).filter(
-        Actuals.practice_id == practice_id,
-        Actuals.budget_period_id.in_(period_ids)
-    ).group_by(
-        AccountCategory.id,
-        AccountCategory.name,
-        AccountCategory.category_type
-    ).all()
-    
-    category_list = [
-        {"id": cat.id, "name": cat.name, "type": cat.category_type, "amount": cat.total or Decimal('0')}
-        for cat in categories
-    ]
-    
-    return schemas.PLReport(
-        practice=schemas.Practice.from_orm(practice),
+    # Every value comes from the database, so skip re-validation and
+    # serialize straight to JSON in pydantic-core
+    report = schemas.PLReport.model_construct(
+        practice=schemas.construct(schemas.Practice, practice),
         start_date=start_date,
         end_date=end_date,
         total_revenue=total_revenue,
@@ -201,3 +234,5 @@ def get_pl_report(
         net_income=net_income,
         categories=category_list
     )
+    
+    return Response(content=report.model_dump_json(), media_type="application/json")
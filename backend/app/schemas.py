@@ -2,12 +2,41 @@
 
 These schemas define the shape of data for API endpoints,
 providing automatic validation, serialization, and documentation.
+
+Request schemas validate client input. Response schemas are built from
+rows the database has already typed, so endpoints create them with
+construct() and skip validation.
 """
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field, validator
+from typing import Annotated, Any, Literal, Optional, List, Type, TypeVar
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+
+# Decimal is immutable, so one shared zero serves as every amount default
+_ZERO = Decimal("0.00")
+
+# Matches the Numeric(15, 2) amount columns
+Money = Annotated[Decimal, Field(max_digits=15, decimal_places=2)]
+
+# Shape check only, matched in pydantic-core without email-validator's
+# IDNA and DNS label parsing
+_EMAIL_RE = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+Email = Annotated[str, StringConstraints(pattern=_EMAIL_RE, max_length=254)]
+
+# Allowed values, checked by pydantic-core without a Python validator call
+CategoryType = Literal['revenue', 'expense', 'metric']
+PeriodStatus = Literal['draft', 'active', 'locked']
+ActualsSource = Literal['manual', 'quickbooks', 'xero', 'import']
+Role = Literal['admin', 'manager', 'viewer']
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def construct(schema: Type[ModelT], obj: Any) -> ModelT:
+    """Build a response schema from a trusted ORM object or row without validation"""
+    return schema.model_construct(**{name: getattr(obj, name) for name in schema.model_fields})
 
 
 # ==================== Practice Schemas ====================
@@ -20,16 +49,19 @@ class PracticeBase(BaseModel):
 class PracticeCreate(PracticeBase):
     pass
 
+# Update schemas are partial: unknown keys are rejected and endpoints apply
+# only the fields the client sent, via model_dump(exclude_unset=True)
 class PracticeUpdate(BaseModel):
     name: Optional[str] = Field(None, max_length=255)
     location: Optional[str] = Field(None, max_length=255)
     status: Optional[str] = Field(None, max_length=50)
+    
+    model_config = ConfigDict(extra='forbid')
 
 class Practice(PracticeBase):
     id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True)
 
 
 # ==================== Fiscal Year Schemas ====================
@@ -46,8 +78,7 @@ class FiscalYearCreate(FiscalYearBase):
 class FiscalYear(FiscalYearBase):
     id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True)
 
 
 # ==================== Account Category Schemas ====================
@@ -55,17 +86,10 @@ class FiscalYear(FiscalYearBase):
 class AccountCategoryBase(BaseModel):
     code: str = Field(..., max_length=20, description="Account code (e.g., 400000)")
     name: str = Field(..., max_length=255)
-    category_type: str = Field(..., description="revenue, expense, or metric")
+    category_type: CategoryType
     parent_id: Optional[int] = None
     level: int = Field(default=0, ge=0, le=5)
     sort_order: int = Field(default=0)
-    
-    @validator('category_type')
-    def validate_category_type(cls, v):
-        allowed = ['revenue', 'expense', 'metric']
-        if v not in allowed:
-            raise ValueError(f'category_type must be one of {allowed}')
-        return v
 
 class AccountCategoryCreate(AccountCategoryBase):
     pass
@@ -73,8 +97,7 @@ class AccountCategoryCreate(AccountCategoryBase):
 class AccountCategory(AccountCategoryBase):
     id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True)
 
 
 # ==================== Budget Period Schemas ====================
@@ -83,14 +106,7 @@ class BudgetPeriodBase(BaseModel):
     fiscal_year_id: int
     period_month: int = Field(..., ge=1, le=12)
     period_date: date
-    status: str = Field(default="draft")
-    
-    @validator('status')
-    def validate_status(cls, v):
-        allowed = ['draft', 'active', 'locked']
-        if v not in allowed:
-            raise ValueError(f'status must be one of {allowed}')
-        return v
+    status: PeriodStatus = "draft"
 
 class BudgetPeriodCreate(BudgetPeriodBase):
     pass
@@ -98,8 +114,7 @@ class BudgetPeriodCreate(BudgetPeriodBase):
 class BudgetPeriod(BudgetPeriodBase):
     id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True)
 
 
 # ==================== Budget Line Schemas ====================
@@ -109,26 +124,27 @@ class BudgetLineBase(BaseModel):
     budget_period_id: int
     category_id: int
     month: int = Field(..., ge=1, le=12)
-    budget_amount: Decimal = Field(default=Decimal("0.00"))
-    actual_amount: Decimal = Field(default=Decimal("0.00"))
-    variance: Decimal = Field(default=Decimal("0.00"))
+    budget_amount: Money = _ZERO
+    actual_amount: Money = _ZERO
     notes: Optional[str] = None
 
 class BudgetLineCreate(BudgetLineBase):
     pass
 
 class BudgetLineUpdate(BaseModel):
-    budget_amount: Optional[Decimal] = None
-    actual_amount: Optional[Decimal] = None
+    budget_amount: Optional[Money] = None
+    actual_amount: Optional[Money] = None
     notes: Optional[str] = None
+    
+    model_config = ConfigDict(extra='forbid')
 
 class BudgetLine(BudgetLineBase):
     id: int
+    variance: Money = Field(default=_ZERO, description="Generated as actual_amount - budget_amount")
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True)
 
 
 # ==================== Actuals Schemas ====================
@@ -137,15 +153,8 @@ class ActualsBase(BaseModel):
     practice_id: int
     category_id: int
     period_date: date
-    amount: Decimal
-    source: str = Field(default="manual")
-    
-    @validator('source')
-    def validate_source(cls, v):
-        allowed = ['manual', 'quickbooks', 'xero', 'import']
-        if v not in allowed:
-            raise ValueError(f'source must be one of {allowed}')
-        return v
+    amount: Money
+    source: ActualsSource = "manual"
 
 class ActualsCreate(ActualsBase):
     pass
@@ -154,40 +163,33 @@ class Actuals(ActualsBase):
     id: int
     imported_at: date
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True)
 
 
 # ==================== User Schemas ====================
 
 class UserBase(BaseModel):
-    email: EmailStr
+    email: Email
     full_name: str = Field(..., max_length=255)
-    role: str = Field(default="viewer")
+    role: Role = "viewer"
     practice_id: Optional[int] = None
-    
-    @validator('role')
-    def validate_role(cls, v):
-        allowed = ['admin', 'manager', 'viewer']
-        if v not in allowed:
-            raise ValueError(f'role must be one of {allowed}')
-        return v
 
 class UserCreate(UserBase):
     password: str = Field(..., min_length=8)
 
 class UserUpdate(BaseModel):
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     full_name: Optional[str] = None
-    role: Optional[str] = None
+    role: Optional[Role] = None
     practice_id: Optional[int] = None
+    
+    model_config = ConfigDict(extra='forbid')
 
 class User(UserBase):
     id: int
     last_login: Optional[date] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True)
 
 
 # ==================== Report Schemas ====================
@@ -202,6 +204,13 @@ class VarianceReport(BaseModel):
     variance_percentage: float
     line_items: List[BudgetLine]
 
+class CategoryTotal(BaseModel):
+    """Actuals total for one account category in a P&L report"""
+    id: int
+    name: str
+    type: CategoryType
+    amount: Decimal
+
 class PLReport(BaseModel):
     """Profit & Loss Report"""
     practice: Practice
@@ -210,7 +219,7 @@ class PLReport(BaseModel):
     total_revenue: Decimal
     total_expenses: Decimal
     net_income: Decimal
-    categories: List[dict]
+    categories: List[CategoryTotal]
 
 
 # ==================== Bulk Operations ====================
@@ -225,18 +234,22 @@ class Token(BaseModel):
 class UserResponse(BaseModel):
     """User response without password"""
     id: int
-    email: EmailStr
+    email: Email
     full_name: str
     role: str
     practice_id: Optional[int] = None
     last_login: Optional[date] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, strict=True, frozen=True)
+
+class BudgetLineUpdateItem(BaseModel):
+    """New budget amount for one budget line"""
+    id: int
+    budget_amount: Money
 
 class BudgetLineBulkUpdate(BaseModel):
     """Bulk update multiple budget lines"""
-    updates: List[dict] = Field(..., description="List of {id: int, budget_amount: Decimal}")
+    updates: List[BudgetLineUpdateItem]
 
 class BulkImportRequest(BaseModel):
     """Request for bulk Excel import"""
@@ -19,188 +19,211 @@ from decimal import Decimal
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database import SessionLocal
-from app.models import Practice, FiscalYear, AccountCategory, BudgetPeriod, BudgetLine
+# SQLAlchemy and the app models are imported inside the functions that use
+# them, so importing this module stays cheap until seeding actually runs
+
+# Built once at import; the seed functions only read these
+_PRACTICES = (
+    {"name": "Beaumont PC", "location": "TX003", "status": "active"},
+    {"name": "Austin PC", "location": "TX001", "status": "active"},
+    {"name": "Red Oak PC", "location": "TX005", "status": "active"},
+    {"name": "Oak Ridge PC", "location": "TX009", "status": "active"},
+    {"name": "Rosenberg PC", "location": "TX011", "status": "active"},
+)
+
+_ACCOUNT_CATEGORIES = (
+    # Metrics
+    {"code": "980015", "name": "Doctor Days", "category_type": "metric", "level": 0, "sort_order": 1},
+    {"code": "980016", "name": "Doctor Days - Ortho", "category_type": "metric", "level": 0, "sort_order": 2},
+    {"code": "980050", "name": "Patients Visits- New", "category_type": "metric", "level": 0, "sort_order": 3},
+    {"code": "980051", "name": "Ortho Patients Visits- New", "category_type": "metric", "level": 0, "sort_order": 4},
+    {"code": "980055", "name": "Patients Visits- Existing", "category_type": "metric", "level": 0, "sort_order": 5},
+    {"code": "980056", "name": "Ortho Patients Visits- Existing", "category_type": "metric", "level": 0, "sort_order": 6},
+
+    # Revenue - Diagnostic
+    {"code": "400000", "name": "Revenue - Diagnostic", "category_type": "revenue", "level": 0, "sort_order": 10},
+
+    # Revenue - Orthodontics  
+    {"code": "400080", "name": "Revenue - Orthodontics", "category_type": "revenue", "level": 0, "sort_order": 11},
+    {"code": "400081", "name": "Revenue - Orthodontics - New Treatment", "category_type": "revenue", "level": 1, "sort_order": 12},
+    {"code": "400083", "name": "Revenue - Orthodontics - Mid Treatment", "category_type": "revenue", "level": 1, "sort_order": 13},
+
+    # Expenses - Office
+    {"code": "640010", "name": "IT - Old Account", "category_type": "expense", "level": 0, "sort_order": 50},
+    {"code": "640080", "name": "Processing Fees", "category_type": "expense", "level": 0, "sort_order": 51},
+    {"code": "640045", "name": "Patient Sundries", "category_type": "expense", "level": 0, "sort_order": 52},
+
+    # Professional Fees
+    {"code": "630000", "name": "Professional Fees - Accounting", "category_type": "expense", "level": 0, "sort_order": 60},
+    {"code": "630010", "name": "Professional Fees - Tax", "category_type": "expense", "level": 0, "sort_order": 61},
+    {"code": "630020", "name": "Professional Fees - Legal", "category_type": "expense", "level": 0, "sort_order": 62},
+
+    # Travel
+    {"code": "530000", "name": "Travel - Lodging", "category_type": "expense", "level": 0, "sort_order": 70},
+    {"code": "530010", "name": "Travel - Airfare", "category_type": "expense", "level": 0, "sort_order": 71},
+    {"code": "530020", "name": "Travel - Transportation", "category_type": "expense", "level": 0, "sort_order": 72},
+
+    # Admin
+    {"code": "520000", "name": "Training and Educational", "category_type": "expense", "level": 0, "sort_order": 80},
+    {"code": "520010", "name": "Conventions", "category_type": "expense", "level": 0, "sort_order": 81},
+)
+
+# First day of each FY 2026 month, in period_month order
+_FY2026_PERIOD_DATES = tuple(date(2026, month, 1) for month in range(1, 13))
 
 
 def seed_practices(db):
     """Seed dental practice locations"""
-    practices_data = [
-        {"name": "Beaumont PC", "location": "TX003", "status": "active"},
-        {"name": "Austin PC", "location": "TX001", "status": "active"},
-        {"name": "Red Oak PC", "location": "TX005", "status": "active"},
-        {"name": "Oak Ridge PC", "location": "TX009", "status": "active"},
-        {"name": "Rosenberg PC", "location": "TX011", "status": "active"},
-    ]
-    
-    for practice_data in practices_data:
-        # Check if practice already exists
-        existing = db.query(Practice).filter(Practice.name == practice_data["name"]).first()
-        if not existing:
-            practice = Practice(**practice_data)
-            db.add(practice)
+    from app.models import Practice
     
-    db.commit()
-    print(f"✓ Seeded {len(practices_data)} practices")
+    # Fetch existing names once and insert only the missing practices
+    existing = {name for (name,) in db.query(Practice.name).all()}
+    new_rows = [d for d in _PRACTICES if d["name"] not in existing]
+    db.bulk_insert_mappings(Practice, new_rows)
+    return len(new_rows)
 
 
 def seed_account_categories(db):
     """Seed account categories from budget structure"""
-    categories_data = [
-        # Metrics
-        {"code": "980015", "name": "Doctor Days", "category_type": "metric", "level": 0, "sort_order": 1},
-        {"code": "980016", "name": "Doctor Days - Ortho", "category_type": "metric", "level": 0, "sort_order": 2},
-        {"code": "980050", "name": "Patients Visits- New", "category_type": "metric", "level": 0, "sort_order": 3},
-        {"code": "980051", "name": "Ortho Patients Visits- New", "category_type": "metric", "level": 0, "sort_order": 4},
-        {"code": "980055", "name": "Patients Visits- Existing", "category_type": "metric", "level": 0, "sort_order": 5},
-        {"code": "980056", "name": "Ortho Patients Visits- Existing", "category_type": "metric", "level": 0, "sort_order": 6},
-        
-        # Revenue - Diagnostic
-        {"code": "400000", "name": "Revenue - Diagnostic", "category_type": "revenue", "level": 0, "sort_order": 10},
-        
-        # Revenue - Orthodontics  
-        {"code": "400080", "name": "Revenue - Orthodontics", "category_type": "revenue", "level": 0, "sort_order": 11},
-        {"code": "400081", "name": "Revenue - Orthodontics - New Treatment", "category_type": "revenue", "level": 1, "sort_order": 12},
-        {"code": "400083", "name": "Revenue - Orthodontics - Mid Treatment", "category_type": "revenue", "level": 1, "sort_order": 13},
-        
-        # Expenses - Office
-        {"code": "640010", "name": "IT - Old Account", "category_type": "expense", "level": 0, "sort_order": 50},
-        {"code": "640080", "name": "Processing Fees", "category_type": "expense", "level": 0, "sort_order": 51},
-        {"code": "640045", "name": "Patient Sundries", "category_type": "expense", "level": 0, "sort_order": 52},
-        
-        # Professional Fees
-        {"code": "630000", "name": "Professional Fees - Accounting", "category_type": "expense", "level": 0, "sort_order": 60},
-        {"code": "630010", "name": "Professional Fees - Tax", "category_type": "expense", "level": 0, "sort_order": 61},
-        {"code": "630020", "name": "Professional Fees - Legal", "category_type": "expense", "level": 0, "sort_order": 62},
-        
-        # Travel
-        {"code": "530000", "name": "Travel - Lodging", "category_type": "expense", "level": 0, "sort_order": 70},
-        {"code": "530010", "name": "Travel - Airfare", "category_type": "expense", "level": 0, "sort_order": 71},
-        {"code": "530020", "name": "Travel - Transportation", "category_type": "expense", "level": 0, "sort_order": 72},
-        
-        # Admin
-        {"code": "520000", "name": "Training and Educational", "category_type": "expense", "level": 0, "sort_order": 80},
-        {"code": "520010", "name": "Conventions", "category_type": "expense", "level": 0, "sort_order": 81},
-    ]
-    
-    for cat_data in categories_data:
-        existing = db.query(AccountCategory).filter(AccountCategory.code == cat_data["code"]).first()
-        if not existing:
-            category = AccountCategory(**cat_data)
-            db.add(category)
+    from app.models import AccountCategory
     
-    db.commit()
-    print(f"✓ Seeded {len(categories_data)} account categories")
+    # Fetch existing codes once and insert only the missing categories
+    existing = {code for (code,) in db.query(AccountCategory.code).all()}
+    new_rows = [d for d in _ACCOUNT_CATEGORIES if d["code"] not in existing]
+    db.bulk_insert_mappings(AccountCategory, new_rows)
+    return len(new_rows)
 
 
 def seed_fiscal_year_and_periods(db):
-    """Create fiscal year 2026 with 12 monthly periods"""
-    # Get first practice for the fiscal year
-    practice = db.query(Practice).first()
-    if not practice:
-        print("✗ No practices found. Seed practices first.")
-        return
-    
-    # Check if fiscal year exists
-    fy = db.query(FiscalYear).filter(
-        FiscalYear.practice_id == practice.id,
-        FiscalYear.year == 2026
-    ).first()
-    
-    if not fy:
-        fy = FiscalYear(
-            practice_id=practice.id,
-            year=2026,
-            start_date=date(2026, 1, 1),
-            end_date=date(2026, 12, 31)
-        )
-        db.add(fy)
-        db.commit()
-        print("✓ Created fiscal year 2026")
-    
-    # Create 12 monthly budget periods
-    for month in range(1, 13):
-        existing_period = db.query(BudgetPeriod).filter(
-            BudgetPeriod.fiscal_year_id == fy.id,
-            BudgetPeriod.period_month == month
-        ).first()
-        
-        if not existing_period:
-            period = BudgetPeriod(
-                fiscal_year_id=fy.id,
-                period_month=month,
-                period_date=date(2026, month, 1),
-                status="active"
-            )
-            db.add(period)
-    
-    db.commit()
-    print("✓ Created 12 monthly budget periods for FY 2026")
+    """Create fiscal year 2026 with 12 monthly periods
+    
+    Returns the number of periods created, or None if there is no practice.
+    """
+    from sqlalchemy import Date, Integer, column, literal, select, true, values
+    from sqlalchemy.dialects.postgresql import insert
+    from app.models import Practice, FiscalYear, BudgetPeriod
+    
+    # Get first practice for the fiscal year; only the id is needed, so no
+    # ORM object is loaded for this lookup
+    practice_id = db.query(Practice.id).limit(1).scalar()
+    if practice_id is None:
+        return None
+    
+    # Upsert the fiscal year and insert its 12 periods in one statement. The
+    # no-op DO UPDATE makes RETURNING yield the id of an existing year too;
+    # months that already exist are skipped by the unique
+    # (fiscal_year_id, period_month) key
+    fy_insert = insert(FiscalYear).values(
+        practice_id=practice_id,
+        year=2026,
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 12, 31)
+    )
+    fiscal_year = fy_insert.on_conflict_do_update(
+        index_elements=["practice_id", "year"],
+        set_={"year": fy_insert.excluded.year}
+    ).returning(FiscalYear.id).cte("fiscal_year")
+    
+    months = values(
+        column("period_month", Integer),
+        column("period_date", Date),
+        name="months"
+    ).data(list(enumerate(_FY2026_PERIOD_DATES, 1)))
+    
+    result = db.execute(
+        insert(BudgetPeriod).from_select(
+            ["fiscal_year_id", "period_month", "period_date", "status"],
+            select(
+                fiscal_year.c.id, months.c.period_month, months.c.period_date, literal("active")
+            ).select_from(fiscal_year.join(months, true()))
+        ).on_conflict_do_nothing(
+            index_elements=["fiscal_year_id", "period_month"]
+        ).add_cte(fiscal_year)
+    )
+    return result.rowcount
 
 
 def seed_sample_budget_data(db):
-    """Seed sample budget data for demonstration"""
-    # Get first practice and first period
-    practice = db.query(Practice).first()
-    if not practice:
-        return
+    """Seed sample budget data for demonstration
+    
+    Returns the number of budget lines created.
+    """
+    from app.models import Practice, FiscalYear, AccountCategory, BudgetPeriod, BudgetLine
+    
+    # Get first practice and first period, selecting ids only
+    practice_id = db.query(Practice.id).limit(1).scalar()
+    if practice_id is None:
+        return 0
     
-    fy = db.query(FiscalYear).filter(FiscalYear.practice_id == practice.id).first()
-    if not fy:
-        return
+    fy_id = db.query(FiscalYear.id).filter(FiscalYear.practice_id == practice_id).limit(1).scalar()
+    if fy_id is None:
+        return 0
     
-    period = db.query(BudgetPeriod).filter(BudgetPeriod.fiscal_year_id == fy.id).first()
-    if not period:
-        return
+    period_id = db.query(BudgetPeriod.id).filter(BudgetPeriod.fiscal_year_id == fy_id).limit(1).scalar()
+    if period_id is None:
+        return 0
     
     # Get some categories
-    categories = db.query(AccountCategory).limit(5).all()
-    
-    for category in categories:
-        existing = db.query(BudgetLine).filter(
-            BudgetLine.practice_id == practice.id,
-            BudgetLine.budget_period_id == period.id,
-            BudgetLine.category_id == category.id
-        ).first()
-        
-        if not existing:
-            budget_line = BudgetLine(
-                practice_id=practice.id,
-                budget_period_id=period.id,
-                category_id=category.id,
-                month=1,
-                budget_amount=Decimal("10000.00"),
-                actual_amount=Decimal("9500.00"),
-                variance=Decimal("500.00")
-            )
-            db.add(budget_line)
-    
-    db.commit()
-    print("✓ Seeded sample budget line items")
+    category_ids = [category_id for (category_id,) in db.query(AccountCategory.id).limit(5).all()]
+    
+    # Find the categories that already have a line in one query
+    existing = {
+        category_id for (category_id,) in db.query(BudgetLine.category_id).filter(
+            BudgetLine.practice_id == practice_id,
+            BudgetLine.budget_period_id == period_id,
+            BudgetLine.category_id.in_(category_ids)
+        ).all()
+    }
+    
+    new_lines = [
+        BudgetLine(
+            practice_id=practice_id,
+            budget_period_id=period_id,
+            category_id=category_id,
+            month=1,
+            budget_amount=Decimal("10000.00"),
+            actual_amount=Decimal("9500.00")
+        )
+        for category_id in category_ids
+        if category_id not in existing
+    ]
+    db.bulk_save_objects(new_lines)
+    return len(new_lines)
 
 
 def main():
     """Main seeding function"""
-    print("\n🌱 Starting database seeding...\n")
+    from app.database import SessionLocal
+    
+    # Status lines are collected and written once at the end
+    report = ["\n🌱 Starting database seeding...\n"]
     
     db = SessionLocal()
     
     try:
-        # Seed in order
-        seed_practices(db)
-        seed_account_categories(db)
-        seed_fiscal_year_and_periods(db)
-        seed_sample_budget_data(db)
+        # Seed in order inside one transaction, committed once at the end
+        # and rolled back as a whole if any step fails
+        with db.begin():
+            report.append(f"✓ Seeded {seed_practices(db)} practices")
+            report.append(f"✓ Seeded {seed_account_categories(db)} account categories")
+            
+            periods = seed_fiscal_year_and_periods(db)
+            if periods is None:
+                report.append("✗ No practices found. Seed practices first.")
+            else:
+                report.append(f"✓ Created {periods} monthly budget periods for FY 2026")
+            
+            report.append(f"✓ Seeded {seed_sample_budget_data(db)} sample budget line items")
         
-        print("\n✅ Database seeding completed successfully!\n")
+        report.append("\n✅ Database seeding completed successfully!\n")
         
     except Exception as e:
-        print(f"\n✗ Error during seeding: {str(e)}\n")
-        db.rollback()
+        report.append(f"\n✗ Error during seeding: {str(e)}\n")
         raise
     
     finally:
         db.close()
+        sys.stdout.write("\n".join(report) + "\n")
 
 
 if __name__ == "__main__":
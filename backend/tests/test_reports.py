@@ -0,0 +1,81 @@
+"""Tests for the streamed variance report body"""
+
+import asyncio
+from collections import namedtuple
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app import schemas
+from app.routers.reports import _stream_variance_report
+
+# Columns selected by _VARIANCE_LINES
+Row = namedtuple("Row", [
+    "id", "practice_id", "budget_period_id", "category_id", "month",
+    "budget_amount", "actual_amount", "variance", "notes", "created_at", "updated_at"
+])
+
+HEADER = {
+    "practice": {"id": 1, "name": "Beaumont PC", "location": "TX003", "status": "active"},
+    "period": {"id": 3, "fiscal_year_id": 1, "period_month": 1, "period_date": "2026-01-01", "status": "active"}
+}
+
+
+class FakeResult:
+    """Stands in for AsyncResult, yielding the given row partitions."""
+
+    def __init__(self, partitions):
+        self._partitions = partitions
+
+    async def partitions(self):
+        for partition in self._partitions:
+            yield partition
+
+
+def make_row(line_id, budget, actual):
+    budget, actual = Decimal(budget), Decimal(actual)
+    now = datetime(2026, 1, 15, 12, 0)
+    return Row(line_id, 1, 3, line_id, 1, budget, actual, actual - budget, None, now, now)
+
+
+def render(partitions):
+    async def collect():
+        return b"".join([chunk async for chunk in _stream_variance_report(HEADER, FakeResult(partitions))])
+    return asyncio.run(collect())
+
+
+def test_no_rows():
+    report = schemas.VarianceReport.model_validate_json(render([]))
+    
+    assert report.line_items == []
+    assert report.total_budget == 0
+    assert report.total_actual == 0
+    assert report.variance_percentage == 0
+
+
+def test_single_partition():
+    report = schemas.VarianceReport.model_validate_json(render([
+        [make_row(1, "100.00", "120.00"), make_row(2, "50.00", "40.00")]
+    ]))
+    
+    assert [line.id for line in report.line_items] == [1, 2]
+    assert report.line_items[1].variance == Decimal("-10.00")
+    assert report.total_budget == Decimal("150.00")
+    assert report.total_actual == Decimal("160.00")
+    assert report.total_variance == Decimal("10.00")
+    assert report.variance_percentage == pytest.approx(10 / 150 * 100)
+
+
+def test_several_partitions():
+    report = schemas.VarianceReport.model_validate_json(render([
+        [make_row(1, "100.00", "90.00")],
+        [make_row(2, "200.00", "200.00"), make_row(3, "0.00", "25.50")],
+        [make_row(4, "10.00", "0.00")]
+    ]))
+    
+    assert [line.id for line in report.line_items] == [1, 2, 3, 4]
+    assert report.practice.name == "Beaumont PC"
+    assert report.total_budget == Decimal("310.00")
+    assert report.total_actual == Decimal("315.50")
+    assert report.total_variance == Decimal("5.50")